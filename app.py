@@ -10,7 +10,7 @@ professionnelle, préférez PhotoRec/TestDisk ou outils professionnels.
 
 Fonctionnalités:
 - Analyse basique: infos système de fichiers, taille, erreurs d'accès
-- Création d'image brute (.img) via dd/tar
+- Création d'image brute (.img) par lecture directe du périphérique (O_DIRECT)
 - Copie simple des fichiers visibles
 - Récupération avancée via pytsk3 (si installé)
 
@@ -35,6 +35,10 @@ Installation:
    sudo apt-get install libtsk-dev
    pip install pytsk3
 
+   Optionnel (Linux) : copie par lots via io_uring :
+
+   pip install liburing
+
 4. Lancez le script :
 
    python usb_recovery.py
@@ -44,11 +48,15 @@ Auteur: Exemple fourni par ChatGPT (en français)
 
 import os
 import sys
+import errno
+import mmap
 import threading
 import shutil
 import ctypes
 import subprocess
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tkinter import Tk, Frame, Button, Label, ttk, filedialog, messagebox, StringVar
 
@@ -59,11 +67,55 @@ try:
 except Exception:
     HAVE_PYTSK3 = False
 
+try:
+    import liburing
+    HAVE_LIBURING = True
+except Exception:
+    HAVE_LIBURING = False
+
+# Nombre de nœuds insérés dans le Treeview par appel planifié sur le thread Tk
+TREE_INSERT_BATCH = 2000
+
+# Taille maximale d'un appel copy_file_range/sendfile et du tampon de repli en espace utilisateur
+COPY_CHUNK = 1 << 30
+COPY_BUFSIZE = 1 << 20
+
+# Copies simultanées : le goulot est la file d'attente du périphérique, pas le CPU
+COPY_WORKERS = min(8, os.cpu_count() or 1)
+# Fréquence (en fichiers) des mises à jour du statut pendant la copie
+COPY_STATUS_EVERY = 50
+# Nombre de fichiers sources ouverts à l'avance (POSIX_FADV_WILLNEED) pendant la copie
+PREFETCH_DEPTH = 4
+# Octets de début de fichier dont la lecture anticipée est demandée au noyau
+PREFETCH_BYTES = 1 << 20
+
+# Profondeur de l'anneau io_uring et nombre de fichiers copiés simultanément par ce backend
+URING_DEPTH = 64
+URING_INFLIGHT = 32
+
+# Tampon de lecture du périphérique pour l'image brute (multiple de mmap.PAGESIZE, aligné pour O_DIRECT)
+IMAGE_BUFSIZE = 4 << 20
+
+# Intervalle minimal (secondes) entre deux détections de lecteurs
+REFRESH_MIN_INTERVAL = 0.5
+
+# Erreurs indiquant que l'appel système n'est pas supporté pour ce couple de fichiers
+_FASTCOPY_FALLBACK_ERRNOS = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EBADF,
+    errno.EPERM, errno.EOPNOTSUPP, getattr(errno, 'ENOTSUP', errno.EOPNOTSUPP),
+}
+
+
+# Windows : (masque GetLogicalDrives, lecteurs amovibles) du dernier appel à list_removable_drives
+_drives_cache = (None, [])
+
 
 def list_removable_drives():
     """
     Détecte les lecteurs amovibles Windows / Linux / macOS.
+    Sous Windows, le résultat est réutilisé tant que le masque des lettres de lecteur ne change pas.
     """
+    global _drives_cache
     drives = []
     platform = sys.platform
 
@@ -72,6 +124,8 @@ def list_removable_drives():
         try:
             GetDriveTypeW = ctypes.windll.kernel32.GetDriveTypeW
             bitmask = ctypes.windll.kernel32.GetLogicalDrives()
+            if _drives_cache[0] == bitmask:
+                return list(_drives_cache[1])
             for i in range(26):
                 if bitmask & (1 << i):
                     drive_letter = f"{chr(65 + i)}:\\"
@@ -81,6 +135,7 @@ def list_removable_drives():
                             drives.append(drive_letter)
                     except Exception:
                         pass
+            _drives_cache = (bitmask, list(drives))
         except Exception:
             pass
     else:
@@ -99,6 +154,314 @@ def list_removable_drives():
     return drives
 
 
+_tls = threading.local()
+
+
+def _copy_fd(in_fd, out_fd):
+    """
+    Copie le contenu de in_fd vers out_fd depuis leurs positions courantes.
+    Essaie copy_file_range puis sendfile (copie dans le noyau), et à défaut un tampon de 1 Mio.
+    """
+    if hasattr(os, 'copy_file_range'):
+        copied = 0
+        try:
+            while True:
+                n = os.copy_file_range(in_fd, out_fd, COPY_CHUNK)
+                if not n:
+                    break
+                copied += n
+        except OSError as e:
+            if e.errno not in _FASTCOPY_FALLBACK_ERRNOS:
+                raise
+        else:
+            # Certains noyaux/systèmes de fichiers renvoient 0 dès le premier appel pour un fichier
+            # non vide : ce n'est une fin de fichier fiable qu'après des octets copiés
+            if copied:
+                return
+
+    if sys.platform.startswith('linux') and hasattr(os, 'sendfile'):
+        start = offset = os.lseek(in_fd, 0, os.SEEK_CUR)
+        try:
+            while True:
+                sent = os.sendfile(out_fd, in_fd, offset, COPY_CHUNK)
+                if not sent:
+                    # Même précaution que pour copy_file_range : 0 au premier appel -> tampon
+                    if offset > start:
+                        return
+                    break
+                offset += sent
+        except OSError as e:
+            if e.errno not in _FASTCOPY_FALLBACK_ERRNOS:
+                raise
+            # sendfile ne déplace pas la position de in_fd lorsqu'un offset est fourni
+            os.lseek(in_fd, offset, os.SEEK_SET)
+
+    # Tampon de repli réutilisé par thread de copie plutôt qu'alloué à chaque fichier
+    view = getattr(_tls, 'copy_view', None)
+    if view is None:
+        view = _tls.copy_view = memoryview(bytearray(COPY_BUFSIZE))
+    with open(in_fd, 'rb', buffering=0, closefd=False) as reader:
+        while True:
+            n = reader.readinto(view)
+            if not n:
+                return
+            written = 0
+            while written < n:
+                written += os.write(out_fd, view[written:n])
+
+
+def _fadvise(fd, advice_name, length=0):
+    """
+    posix_fadvise sur les `length` premiers octets (0 : tout le fichier) si la plateforme le propose
+    (absent sous Windows/macOS).
+    """
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(fd, 0, length, getattr(os, advice_name))
+        except OSError:
+            pass
+
+
+def _fastcopy(src, dst, out_fd=None, in_fd=None):
+    """
+    Copie src vers dst en gardant les données dans le noyau quand c'est possible, puis recopie
+    les métadonnées (dates, permissions) comme shutil.copy2.
+    out_fd (voir _open_unique_dest) et in_fd (voir _prefetch_source), s'ils sont fournis, remplacent
+    l'ouverture de dst / src ; ils sont fermés dans tous les cas.
+    """
+    flags = getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+    try:
+        # Source d'abord : une source illisible ne doit pas laisser de fichier vide à destination
+        if in_fd is None:
+            in_fd = os.open(src, os.O_RDONLY | flags)
+        if out_fd is None:
+            out_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | flags, 0o666)
+        _fadvise(in_fd, 'POSIX_FADV_SEQUENTIAL')
+        _copy_fd(in_fd, out_fd)
+        # Libère le cache de pages : une clé entière ne doit pas évincer le reste du système
+        _fadvise(in_fd, 'POSIX_FADV_DONTNEED')
+        _fadvise(out_fd, 'POSIX_FADV_DONTNEED')
+    finally:
+        for fd in (in_fd, out_fd):
+            if fd is not None:
+                os.close(fd)
+    shutil.copystat(src, dst)
+
+
+def _prefetch_source(path):
+    """
+    Ouvre path en lecture et demande au noyau de commencer à charger ses PREFETCH_BYTES premiers octets
+    (POSIX_FADV_WILLNEED), pendant que les fichiers précédents sont encore en cours de copie.
+    La fenêtre est bornée pour ne pas remplir le cache de pages ni saturer la file du périphérique.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+    _fadvise(fd, 'POSIX_FADV_WILLNEED', PREFETCH_BYTES)
+    return fd
+
+
+def _take_prefetched(opened):
+    """
+    Renvoie le descripteur préouvert par _prefetch_source s'il est déjà prêt, sinon None
+    (l'appelant ouvre alors la source lui-même plutôt que d'attendre le thread de préchargement).
+    Une préouverture abandonnée est annulée, ou son descripteur fermé dès qu'elle se termine.
+    """
+    if opened.done() and not opened.cancelled() and opened.exception() is None:
+        return opened.result()
+    if not opened.cancel():
+        opened.add_done_callback(_close_prefetched)
+    return None
+
+
+def _close_prefetched(opened):
+    if not opened.cancelled() and opened.exception() is None:
+        os.close(opened.result())
+
+
+def _open_unique_dest(dp):
+    """
+    Crée dp en O_EXCL (pas de stat préalable sur le chemin habituel : destination neuve).
+    Si dp existe déjà, écrit dans base_copy.ext comme auparavant. Renvoie (fd, chemin effectif).
+    """
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+    try:
+        return os.open(dp, flags | os.O_EXCL, 0o666), dp
+    except FileExistsError:
+        base, ext = os.path.splitext(dp)
+        dp = base + '_copy' + ext
+        return os.open(dp, flags | os.O_TRUNC, 0o666), dp
+
+
+def _uring_copy(pairs, on_done):
+    """
+    Copie les couples (source, destination) via io_uring (Linux, module liburing) : jusqu'à
+    URING_INFLIGHT fichiers sont en vol, chacun alternant lecture et écriture de COPY_BUFSIZE octets,
+    et un seul io_uring_enter soumet/récolte tout un lot d'opérations.
+    Un fichier dont une opération échoue est recopié avec _fastcopy. on_done est appelé par fichier.
+    Renvoie False si l'anneau ne peut pas être créé (noyau trop ancien, io_uring désactivé).
+    """
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    try:
+        liburing.io_uring_queue_init(URING_DEPTH, ring, liburing.IORING_SETUP_SQPOLL)
+    except OSError:
+        # SQPOLL demande des privilèges sur les noyaux anciens
+        try:
+            liburing.io_uring_queue_init(URING_DEPTH, ring)
+        except OSError:
+            return False
+
+    flags = getattr(os, 'O_CLOEXEC', 0)
+    bufs = [bytearray(COPY_BUFSIZE) for _ in range(URING_INFLIGHT)]
+    # slot -> [source, destination, in_fd, out_fd, offset, tampon en cours d'écriture]
+    # Le tampon doit rester référencé tant que le noyau ne l'a pas consommé
+    slots = {}
+    todo = iter(pairs)
+
+    def submit(slot, write, buf):
+        state = slots[slot]
+        sqe = liburing.io_uring_get_sqe(ring)
+        if write:
+            state[5] = buf
+            liburing.io_uring_prep_write(sqe, state[3], buf, state[4])
+        else:
+            liburing.io_uring_prep_read(sqe, state[2], buf, state[4])
+        liburing.io_uring_sqe_set_data64(sqe, slot << 1 | write)
+
+    def start(slot):
+        for sp, dp in todo:
+            try:
+                in_fd = os.open(sp, os.O_RDONLY | flags)
+            except OSError as e:
+                print('Erreur copie:', sp, e)
+                on_done()
+                continue
+            try:
+                out_fd, dp = _open_unique_dest(dp)
+            except OSError as e:
+                os.close(in_fd)
+                print('Erreur copie:', sp, e)
+                on_done()
+                continue
+            _fadvise(in_fd, 'POSIX_FADV_SEQUENTIAL')
+            slots[slot] = [sp, dp, in_fd, out_fd, 0, None]
+            submit(slot, 0, bufs[slot])
+            return
+
+    def finish(slot, ok):
+        sp, dp, in_fd, out_fd = slots.pop(slot)[:4]
+        if ok:
+            _fadvise(in_fd, 'POSIX_FADV_DONTNEED')
+            _fadvise(out_fd, 'POSIX_FADV_DONTNEED')
+        os.close(in_fd)
+        os.close(out_fd)
+        try:
+            if ok:
+                shutil.copystat(sp, dp)
+            else:
+                _fastcopy(sp, dp)
+        except Exception as e:
+            print('Erreur copie:', sp, e)
+        on_done()
+        start(slot)
+
+    try:
+        for slot in range(URING_INFLIGHT):
+            start(slot)
+        while slots:
+            liburing.io_uring_submit_and_wait(ring, 1)
+            done = []
+            for _ in range(liburing.io_uring_cq_ready(ring)):
+                # cqe[0] seulement : l'indexation au-delà ne gère pas le rebouclage de la file
+                liburing.io_uring_wait_cqe(ring, cqe)
+                entry = cqe[0]
+                data = entry.user_data
+                try:
+                    res = entry.res
+                except OSError:
+                    # liburing lève une exception pour un résultat négatif (-errno)
+                    res = -1
+                liburing.io_uring_cqe_seen(ring, entry)
+                done.append((data, res))
+            for data, res in done:
+                slot, write = data >> 1, data & 1
+                state = slots[slot]
+                if res < 0 or (write and res != len(state[5])):
+                    finish(slot, False)
+                elif write:
+                    state[4] += res
+                    submit(slot, 0, bufs[slot])
+                elif res == 0:
+                    finish(slot, True)
+                else:
+                    # io_uring_prep_write n'accepte pas de memoryview : copie pour un bloc partiel
+                    submit(slot, 1, bufs[slot] if res == COPY_BUFSIZE else bytes(bufs[slot][:res]))
+    finally:
+        for state in slots.values():
+            os.close(state[2])
+            os.close(state[3])
+        liburing.io_uring_queue_exit(ring)
+    return True
+
+
+def device_for_mount(path):
+    """
+    Renvoie le périphérique bloc correspondant au point de montage / lecteur sélectionné.
+    """
+    if sys.platform.startswith('win'):
+        return '\\\\.\\' + os.path.splitdrive(path)[0]
+    out = subprocess.run(['df', '-P', path], capture_output=True, text=True, check=True).stdout
+    return out.splitlines()[-1].split()[0]
+
+
+def create_raw_image(device, img_path, progress=None):
+    """
+    Copie bit-à-bit `device` vers `img_path` avec un tampon aligné de 4 Mio.
+    Le périphérique est ouvert en O_DIRECT quand c'est possible (pas de passage par le cache de pages),
+    sinon le noyau est prévenu d'une lecture séquentielle sans réutilisation via posix_fadvise.
+    `progress(octets_copiés)` est appelé après chaque bloc. Renvoie le nombre d'octets copiés.
+    """
+    flags = os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+    direct = getattr(os, 'O_DIRECT', 0)
+    try:
+        in_fd = os.open(device, flags | direct)
+    except OSError:
+        if not direct:
+            raise
+        direct = 0
+        in_fd = os.open(device, flags)
+    try:
+        if not direct and hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            os.posix_fadvise(in_fd, 0, 0, os.POSIX_FADV_NOREUSE)
+        out_flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+        # mmap anonyme : mémoire alignée sur la page, requise par O_DIRECT
+        buf = mmap.mmap(-1, IMAGE_BUFSIZE)
+        view = memoryview(buf)
+        copied = 0
+        try:
+            out_fd = os.open(img_path, out_flags, 0o644)
+            try:
+                with open(in_fd, 'rb', buffering=0, closefd=False) as reader:
+                    while True:
+                        n = reader.readinto(buf)
+                        if not n:
+                            break
+                        written = 0
+                        while written < n:
+                            written += os.write(out_fd, view[written:n])
+                        copied += n
+                        if progress:
+                            progress(copied)
+            finally:
+                os.close(out_fd)
+        finally:
+            view.release()
+            buf.close()
+    finally:
+        os.close(in_fd)
+    return copied
+
+
 class USBRecoveryAppAdvanced:
     def __init__(self, master):
         self.master = master
@@ -107,6 +470,13 @@ class USBRecoveryAppAdvanced:
 
         self.drive_var = StringVar()
         self.destination = None
+        self._copy_lock = threading.Lock()
+        self._copy_done = 0
+        self._copy_total = 0
+        self._refreshing = False
+        self._last_refresh_ts = 0.0
+        # Incrémenté à chaque vidage de l'arbre : les lots d'un listage lancé avant sont ignorés
+        self._tree_generation = 0
 
         top_frame = Frame(master)
         top_frame.pack(fill='x', padx=8, pady=6)
@@ -128,66 +498,133 @@ class USBRecoveryAppAdvanced:
         vsb = ttk.Scrollbar(mid_frame, orient='vertical', command=self.tree.yview)
         vsb.pack(side='left', fill='y')
         self.tree.configure(yscrollcommand=vsb.set)
+        self.tree.bind('<<TreeviewOpen>>', self._on_expand)
 
         right_frame = Frame(master)
         right_frame.pack(fill='x', padx=8, pady=6)
 
         Button(right_frame, text='Choisir dossier destination', command=self.choose_destination).pack(side='left', padx=6)
         Button(right_frame, text='Copier tout', command=self.copy_all).pack(side='left', padx=6)
+        Button(right_frame, text='Créer image brute', command=self.create_image).pack(side='left', padx=6)
         Button(right_frame, text='Quitter', command=master.quit).pack(side='right', padx=6)
 
         self.status_label = Label(master, text='Statut: prêt')
         self.status_label.pack(fill='x', padx=8, pady=4)
 
+        # Dernier statut demandé ; appliqué par _drain_status sur le thread Tk (appelable depuis les threads de travail)
+        self._status_queue = deque(maxlen=1)
+        self.master.after(100, self._drain_status)
+
         self.refresh_drives()
 
     def set_status(self, text):
-        self.status_label.config(text=f'Statut: {text}')
-        self.master.update_idletasks()
+        self._status_queue.append(text)
+
+    def _drain_status(self):
+        try:
+            text = self._status_queue.pop()
+        except IndexError:
+            pass
+        else:
+            self.status_label.config(text=f'Statut: {text}')
+        self.master.after(100, self._drain_status)
 
     def refresh_drives(self):
+        """
+        Lance la détection des lecteurs dans un thread ; ignorée si une détection est en cours
+        ou si la précédente date de moins de REFRESH_MIN_INTERVAL secondes.
+        """
+        now = time.monotonic()
+        if self._refreshing or now - self._last_refresh_ts < REFRESH_MIN_INTERVAL:
+            return
+        self._refreshing = True
+        self._last_refresh_ts = now
         self.set_status('Détection des lecteurs...')
-        drives = list_removable_drives()
+        threading.Thread(target=self._enumerate_drives, daemon=True).start()
+
+    def _enumerate_drives(self):
+        drives = []
+        try:
+            drives = list_removable_drives()
+        finally:
+            self.master.after(0, self._apply_drives, drives)
+
+    def _apply_drives(self, drives):
+        self._refreshing = False
+        self._tree_generation += 1
         self.drives_combo['values'] = drives
         if drives:
             self.drives_combo.current(0)
             self.drive_var.set(drives[0])
         else:
             self.drive_var.set('')
-        self.tree.delete(*self.tree.get_children())
+        self._clear_tree()
         self.set_status('Prêt')
 
+    def _clear_tree(self):
+        children = self.tree.get_children('')
+        if children:
+            self.tree.delete(*children)
+
     def open_selected_drive(self):
         path = self.drive_var.get()
         if not path:
             messagebox.showwarning('Aucun lecteur', 'Aucun lecteur amovible sélectionné.')
             return
-        threading.Thread(target=self._populate_tree, args=(path,), daemon=True).start()
+        self._tree_generation += 1
+        self._clear_tree()
+        name = os.path.basename(path.rstrip(os.sep)) or path
+        self.tree.insert('', 'end', iid=path, text=name, values=(path,), open=True)
+        threading.Thread(target=self._populate_tree, args=(path, self._tree_generation), daemon=True).start()
 
-    def _populate_tree(self, root_path):
+    def _populate_tree(self, root_path, generation):
         self.set_status(f'Lecture de {root_path} ...')
-        self.tree.delete(*self.tree.get_children())
-
-        def insert_node(parent, fullpath):
-            basename = os.path.basename(fullpath) or fullpath
-            node = self.tree.insert(parent, 'end', text=basename, values=(fullpath,))
-            return node
-
-        root_node = insert_node('', root_path)
-        for dirpath, dirnames, filenames in os.walk(root_path):
-            rel = os.path.relpath(dirpath, root_path)
-            parent_node = root_node if rel == '.' else root_node
-            for d in dirnames:
-                try:
-                    self.tree.insert(parent_node, 'end', text=d)
-                except Exception:
-                    pass
-            for f in filenames:
-                try:
-                    self.tree.insert(parent_node, 'end', text=f)
-                except Exception:
-                    pass
-        self.set_status('Arborescence chargée')
+        self._load_children(root_path, generation)
+        self.master.after(0, self.set_status, 'Arborescence chargée')
+
+    def _load_children(self, path, generation):
+        """
+        Liste un seul niveau de `path` dans le thread de travail et transmet les nœuds au thread Tk par lots.
+        Les sous-dossiers reçoivent un enfant fictif et ne sont lus qu'à leur ouverture (_on_expand).
+        Le chemin complet sert d'identifiant (iid) de nœud ; `generation` (voir _tree_generation) permet
+        à _flush_inserts d'écarter les lots arrivés après un vidage de l'arbre.
+        """
+        pending = []
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    pending.append((path, entry.path, entry.name, entry.is_dir(follow_symlinks=False)))
+                    if len(pending) >= TREE_INSERT_BATCH:
+                        self.master.after(0, self._flush_inserts, generation, pending)
+                        pending = []
+        except OSError as e:
+            print('Erreur lecture dossier:', path, e)
+        if pending:
+            self.master.after(0, self._flush_inserts, generation, pending)
+
+    def _flush_inserts(self, generation, chunk):
+        if generation != self._tree_generation:
+            return
+        # Un lot provient d'un seul dossier. insert échoue si le parent n'existe plus ou si un iid (chemin) est
+        # déjà présent ; les lots d'un arbre vidé entre-temps sont écartés ci-dessus, et une erreur restante
+        # abandonne le reste du lot
+        insert = self.tree.insert
+        try:
+            for parent, fullpath, name, is_dir in chunk:
+                insert(parent, 'end', iid=fullpath, text=name, values=(fullpath,))
+                if is_dir:
+                    insert(fullpath, 'end', text='chargement...', tags=('placeholder',))
+        except Exception:
+            pass
+
+    def _on_expand(self, event):
+        node = self.tree.focus()
+        children = self.tree.get_children(node)
+        if len(children) != 1 or not self.tree.tag_has('placeholder', children[0]):
+            return
+        self.tree.delete(children[0])
+        path = self.tree.item(node, 'values')[0]
+        threading.Thread(target=self._load_children, args=(path, self._tree_generation), daemon=True).start()
 
     def choose_destination(self):
         dst = filedialog.askdirectory(title='Choisir dossier destination')
@@ -195,6 +632,30 @@ class USBRecoveryAppAdvanced:
             self.destination = dst
             self.set_status(f'Destination: {dst}')
 
+    def create_image(self):
+        src = self.drive_var.get()
+        if not src:
+            messagebox.showwarning('Aucun lecteur', 'Aucun lecteur amovible sélectionné.')
+            return
+        img_path = filedialog.asksaveasfilename(title="Enregistrer l'image brute", defaultextension='.img',
+                                                filetypes=[('Image brute', '*.img'), ('Tous les fichiers', '*.*')])
+        if img_path:
+            threading.Thread(target=self._create_image_thread, args=(src, img_path), daemon=True).start()
+
+    def _create_image_thread(self, src, img_path):
+        def progress(copied):
+            self.set_status(f'Image en cours... {copied // (1 << 20)} Mio copiés')
+
+        try:
+            device = device_for_mount(src)
+            self.set_status(f'Création de l\'image de {device} ...')
+            copied = create_raw_image(device, img_path, progress)
+            self.set_status(f'Image terminée ({copied // (1 << 20)} Mio)')
+            messagebox.showinfo('Terminé', f'Image brute créée : {img_path}')
+        except Exception as e:
+            self.set_status("Erreur lors de la création de l'image")
+            messagebox.showerror('Erreur', f'Une erreur est survenue pendant la création de l\'image: {e}')
+
     def copy_all(self):
         src = self.drive_var.get()
         if not src:
@@ -230,22 +691,91 @@ class USBRecoveryAppAdvanced:
             messagebox.showerror('Erreur', f'Une erreur est survenue pendant la copie: {e}')
 
     def _copy_tree(self, src, dst):
+        """
+        Recrée l'arborescence de src sous dst (dossiers créés séquentiellement), puis copie
+        les fichiers en parallèle pour recouvrir la latence d'ouverture/lecture du périphérique.
+        """
         if not os.path.exists(src):
             return
-        for root, dirs, files in os.walk(src):
-            rel = os.path.relpath(root, src)
-            target_root = os.path.join(dst, rel) if rel != '.' else dst
-            os.makedirs(target_root, exist_ok=True)
-            for f in files:
-                sp = os.path.join(root, f)
-                dp = os.path.join(target_root, f)
+        os.makedirs(dst, exist_ok=True)
+        pairs = self._collect_copy_pairs(src, dst)
+
+        with self._copy_lock:
+            self._copy_done = 0
+            self._copy_total = len(pairs)
+        if HAVE_LIBURING and sys.platform.startswith('linux') and _uring_copy(pairs, self._count_copied):
+            return
+        # Un thread ouvre les sources à l'avance ; le sémaphore borne l'avance à PREFETCH_DEPTH fichiers
+        # au-delà de ceux en cours de copie (et donc le nombre de descripteurs ouverts)
+        slots = threading.BoundedSemaphore(COPY_WORKERS + PREFETCH_DEPTH)
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as executor, \
+                ThreadPoolExecutor(max_workers=1) as prefetcher:
+            for pair in pairs:
+                slots.acquire()
+                opened = prefetcher.submit(_prefetch_source, pair[0])
+                future = executor.submit(self._fastcopy_pair, pair, opened)
+                future.add_done_callback(lambda _: slots.release())
+
+    def _collect_copy_pairs(self, src, dst):
+        """
+        Crée les dossiers cibles et renvoie les couples (source, destination) des fichiers à copier.
+        Chaque dossier est empilé avec son dossier cible déjà calculé (terminé par un séparateur) :
+        les chemins de destination s'obtiennent par concaténation, sans relpath ni table de correspondance.
+        """
+        pairs = []
+        stack = [(src, os.path.join(dst, ''))]
+        while stack:
+            src_dir, target_sep = stack.pop()
+            try:
+                with os.scandir(src_dir) as it:
+                    entries = list(it)
+            except OSError as e:
+                print('Erreur lecture dossier:', src_dir, e)
+                continue
+            for entry in entries:
+                dp = target_sep + entry.name
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                    # Lien vers un dossier : ignoré, comme os.walk(followlinks=False) auparavant
+                    skip = not is_dir and entry.is_symlink() and entry.is_dir()
+                except OSError:
+                    is_dir = skip = False
+                if skip:
+                    continue
+                if not is_dir:
+                    pairs.append((entry.path, dp))
+                    continue
                 try:
-                    if os.path.exists(dp):
-                        base, ext = os.path.splitext(dp)
-                        dp = base + '_copy' + ext
-                    shutil.copy2(sp, dp)
-                except Exception as e:
-                    print('Erreur copie:', sp, e)
+                    os.makedirs(dp, exist_ok=True)
+                except OSError as e:
+                    print('Erreur création dossier:', dp, e)
+                    continue
+                stack.append((entry.path, dp + os.sep))
+        return pairs
+
+    def _fastcopy_pair(self, pair, opened=None):
+        sp, dp = pair
+        try:
+            in_fd = _take_prefetched(opened) if opened is not None else None
+            if in_fd is None:
+                in_fd = os.open(sp, os.O_RDONLY | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0))
+            # La destination n'est créée qu'une fois la source ouverte (pas de fichier vide en cas d'échec)
+            try:
+                out_fd, dp = _open_unique_dest(dp)
+            except OSError:
+                os.close(in_fd)
+                raise
+            _fastcopy(sp, dp, out_fd, in_fd)
+        except Exception as e:
+            print('Erreur copie:', sp, e)
+        self._count_copied()
+
+    def _count_copied(self):
+        with self._copy_lock:
+            self._copy_done += 1
+            done, total = self._copy_done, self._copy_total
+        if done % COPY_STATUS_EVERY == 0 or done == total:
+            self.set_status(f'Copie en cours... {done}/{total} fichiers')
 
 
 if __name__ == '__main__':